@@ -0,0 +1,117 @@
+"""Hostile connections shed per second by a single worker.
+
+Starts the app on one uvicorn worker with 127.0.0.1 blacklisted, once with
+the stock HTTP protocol and once behind ConnectionGuard, then hammers it
+from loopback and counts how many connections are turned away per second.
+
+Run from the backend directory:
+
+    python benchmarks/connection_shedding.py [--duration 5] [--concurrency 64]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from typing import Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HOST = "127.0.0.1"
+REQUEST = b"GET /api/traffic HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
+
+
+def serve(port: int, guarded: bool, ready) -> None:
+    import uvicorn
+    import api
+
+    api.ddos_detector.defense.blacklist.add(HOST)
+    http = api.connection_guard.protocol_class() if guarded else "auto"
+    config = uvicorn.Config(api.app, host=HOST, port=port, http=http,
+                            log_level="warning", access_log=False)
+    server = uvicorn.Server(config)
+    ready.set()
+    server.run()
+
+
+async def hammer(port: int, duration: float, concurrency: int, guarded: bool) -> Tuple[int, int]:
+    """Count connections that were refused, and those that were not"""
+    shed = 0
+    other = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal shed, other
+        while time.perf_counter() < deadline:
+            try:
+                reader, writer = await asyncio.open_connection(HOST, port)
+                writer.write(REQUEST)
+                response = await reader.read()
+                writer.close()
+            except ConnectionResetError:
+                response = None
+            except OSError:
+                other += 1
+                continue
+
+            if guarded:
+                # The guard aborts before HTTP: a reset or an empty read
+                refused = not response
+            else:
+                refused = response is not None and response.startswith(b"HTTP/1.1 429")
+            if refused:
+                shed += 1
+            else:
+                other += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return shed, other
+
+
+async def wait_for_port(port: int, timeout: float = 60) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            _, writer = await asyncio.open_connection(HOST, port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def run_case(guarded: bool, port: int, duration: float, concurrency: int) -> float:
+    ready = multiprocessing.Event()
+    proc = multiprocessing.Process(target=serve, args=(port, guarded, ready), daemon=True)
+    proc.start()
+    try:
+        ready.wait(120)
+        asyncio.run(wait_for_port(port))
+        shed, other = asyncio.run(hammer(port, duration, concurrency, guarded))
+        if other:
+            print(f"warning: {other} connections were not refused "
+                  f"({'guard' if guarded else 'middleware'} case)")
+        return shed / duration
+    finally:
+        proc.terminate()
+        proc.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    baseline = run_case(False, args.port, args.duration, args.concurrency)
+    guarded = run_case(True, args.port + 1, args.duration, args.concurrency)
+
+    print(f"middleware 429:   {baseline:10.0f} conn/s")
+    print(f"connection guard: {guarded:10.0f} conn/s")
+    print(f"speedup:          {guarded / baseline:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
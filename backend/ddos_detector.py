@@ -1,10 +1,12 @@
 
 import logging
 import time
-from typing import Dict, Any
+from collections import deque
+from typing import Dict, Any, Optional
 from security.proof_of_work import ProofOfWork
 from security.defense_mechanisms import DefenseMechanisms
 from ml.attack_detector import AttackDetector
+from rule_engine import RuleEngine
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,6 +19,8 @@ class DDoSDetector:
         self.pow_validator = ProofOfWork()
         self.defense = DefenseMechanisms()
         self.detector = AttackDetector()
+        self.rules = RuleEngine()
+        self.recent_rps = deque(maxlen=self.rules.ruleset.sustained_window)
         self.last_log_time = time.time()
         self.log_interval = 1
         self.attack_stats = {
@@ -25,7 +29,7 @@ class DDoSDetector:
             'attack_types': {}
         }
         
-    def is_attack(self, request: Dict[str, Any]) -> bool:
+    def is_attack(self, request: Dict[str, Any], route: Optional[str] = None, tenant: Optional[str] = None) -> bool:
         try:
             ip = request.get('source_ip', 'unknown')
             
@@ -38,38 +42,27 @@ class DDoSDetector:
                 logging.info(f"Blocked request from blacklisted IP: {ip}")
                 return True
             
-            # Lower threshold for SYN flood detection (typical for hping3 attacks)
-            if request.get('syn_count', 0) > 50:  # Lowered from 500
-                self._update_attack_stats('syn_flood')
-                self.defense._apply_defense(ip, 'syn_flood')
-                self._log_attack(request, 1.0, "SYN flood detected")
-                return True
+            ruleset = self.rules.maybe_reload()
+            evaluate = ruleset.select(route, tenant) if route or tenant else ruleset.evaluate
             
             features = self.detector.extract_features(request)
             self.detector.request_window.append(features)
             
-            # More sensitive RPS threshold (for ab and wrk tools)
-            if features[0] > 500:  # Lowered from 2000
-                self._update_attack_stats('http_flood')
-                self.defense._apply_defense(ip, 'http_flood')
-                self._log_attack(request, 1.0, "High RPS detected")
-                return True
-                
-            # More sensitive bandwidth threshold
-            if features[1] > 100000:  # Lowered from 1000000
-                self._update_attack_stats('bandwidth_flood')
-                self.defense._apply_defense(ip, 'bandwidth_flood')
-                self._log_attack(request, 1.0, "High bandwidth usage detected")
-                return True
+            # Average RPS over the last sustained_window requests
+            if self.recent_rps.maxlen != ruleset.sustained_window:
+                self.recent_rps = deque(self.recent_rps, maxlen=ruleset.sustained_window)
+            self.recent_rps.append(features[0])
+            sustained_rps = (sum(self.recent_rps) / len(self.recent_rps)
+                             if len(self.recent_rps) == self.recent_rps.maxlen else 0.0)
             
-            # Check for sustained high traffic
-            if len(self.detector.request_window) >= 10:
-                recent_requests = [r[0] for r in list(self.detector.request_window)[-10:]]
-                avg_rps = sum(recent_requests) / len(recent_requests)
-                if avg_rps > 300:  # Lowered from 1500
-                    self._update_attack_stats('statistical_anomaly')
-                    self.defense._apply_defense(ip, 'sustained_attack')
-                    return True
+            rule = evaluate(request.get('syn_count', 0), features[0], features[1], features[2], sustained_rps)
+            if rule is not None:
+                self._update_attack_stats(rule.name)
+                if rule.defense:
+                    self.defense._apply_defense(ip, rule.defense)
+                if rule.message:
+                    self._log_attack(request, 1.0, rule.message)
+                return True
                 
             return False
             
@@ -0,0 +1,262 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from enum import Enum, IntEnum
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class Priority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+class RejectionPolicy(Enum):
+    ABORT = "abort"  # refuse the new task when the queue is full
+    DISCARD_LOWEST = "discard_lowest"  # evict the lowest-priority queued task if the new one outranks it
+
+class ExecutorRejected(RuntimeError):
+    """Raised (or set on a future) when a pool refuses or evicts a task"""
+
+class PriorityThreadPool:
+    """Fixed-size thread pool fed from a bounded priority queue.
+
+    Submitting never blocks: when the queue is full the rejection policy
+    decides which task loses, and the loser's future raises ExecutorRejected.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int,
+                 rejection_policy: RejectionPolicy = RejectionPolicy.ABORT):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rejection_policy = rejection_policy
+        self._queue: List[tuple] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0}
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"{name}-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn: Callable, *args, priority: Priority = Priority.NORMAL, **kwargs) -> Future:
+        future: Future = Future()
+        item = (int(priority), next(self._sequence), future, fn, args, kwargs)
+        with self._condition:
+            if self._shutdown:
+                raise ExecutorRejected(f"{self.name} pool is shut down")
+            if len(self._queue) >= self.max_queue:
+                self._make_room(item)
+            heapq.heappush(self._queue, item)
+            self.stats['submitted'] += 1
+            self._condition.notify()
+        return future
+
+    def _make_room(self, item: tuple) -> None:
+        """Apply the rejection policy to a full queue; caller holds the lock"""
+        # Tasks cancelled while queued (e.g. via asyncio.wrap_future) free their slot
+        live = [queued for queued in self._queue if not queued[2].cancelled()]
+        if len(live) < len(self._queue):
+            self._queue = live
+            heapq.heapify(self._queue)
+            if len(self._queue) < self.max_queue:
+                return
+
+        if self.rejection_policy == RejectionPolicy.DISCARD_LOWEST:
+            lowest = max(self._queue)
+            if lowest[:2] > item[:2]:
+                self._queue.remove(lowest)
+                heapq.heapify(self._queue)
+                # False if it was cancelled since the sweep; the slot is free either way
+                if lowest[2].set_running_or_notify_cancel():
+                    self.stats['rejected'] += 1
+                    lowest[2].set_exception(ExecutorRejected(f"{self.name} pool evicted a lower-priority task"))
+                return
+        self.stats['rejected'] += 1
+        raise ExecutorRejected(f"{self.name} pool queue is full ({self.max_queue} tasks)")
+
+    def _worker(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                _, _, future, fn, args, kwargs = heapq.heappop(self._queue)
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                self._count('failed')
+                future.set_exception(e)
+            else:
+                self._count('completed')
+                future.set_result(result)
+
+    def _count(self, stat: str) -> None:
+        with self._condition:
+            self.stats[stat] += 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting tasks; queued tasks still run before workers exit"""
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'queued': len(self._queue),
+            'max_queue': self.max_queue,
+            'workers': self.max_workers,
+            'rejection_policy': self.rejection_policy.value
+        }
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up from a fixed-interval sleep"""
+
+    def __init__(self, interval: float = 0.5, warn_threshold: float = 0.1):
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self.stats = {'last_lag': 0.0, 'max_lag': 0.0, 'avg_lag': 0.0, 'samples': 0, 'slow_ticks': 0}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - start - self.interval, 0.0)
+
+            self.stats['samples'] += 1
+            self.stats['last_lag'] = lag
+            self.stats['max_lag'] = max(self.stats['max_lag'], lag)
+            # Exponential moving average, weighted towards recent ticks
+            self.stats['avg_lag'] += (lag - self.stats['avg_lag']) * 0.1
+            if lag > self.warn_threshold:
+                self.stats['slow_ticks'] += 1
+                logger.warning(f"Event loop lag {lag * 1000:.1f} ms exceeds {self.warn_threshold * 1000:.0f} ms")
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+def _run_in_process(pool: ProcessPoolExecutor, fn: Callable, args: tuple, kwargs: Dict) -> Any:
+    return pool.submit(fn, *args, **kwargs).result()
+
+class ExecutorManager:
+    """Shared executors for work that must stay off the event loop.
+
+    I/O-bound work (file writes, blocking library calls) runs on a thread
+    pool; CPU-bound work runs in a process pool. Both lanes are bounded and
+    prioritised, and file logging is moved to a background listener thread.
+    The request protection path never submits here, so it cannot queue
+    behind background work.
+    """
+
+    def __init__(self, io_workers: int = 4, io_queue: int = 1000,
+                 cpu_workers: Optional[int] = None, cpu_queue: int = 100,
+                 log_queue: int = 10000):
+        cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.io = PriorityThreadPool("io", io_workers, io_queue, RejectionPolicy.DISCARD_LOWEST)
+        # One dispatcher thread per process keeps the process pool's own
+        # (unbounded, FIFO) queue empty so priority and bounds apply
+        self.cpu = PriorityThreadPool("cpu", cpu_workers, cpu_queue, RejectionPolicy.ABORT)
+        # spawn rather than fork: the parent has TensorFlow threads running
+        self._process_pool = ProcessPoolExecutor(
+            max_workers=cpu_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self.loop_monitor = LoopLagMonitor()
+        self._log_queue_size = log_queue
+        self._log_handler: Optional[DroppingQueueHandler] = None
+        self._log_listener: Optional[QueueListener] = None
+        self._original_log_handlers: List[logging.Handler] = []
+
+    def submit_io(self, fn: Callable, *args, priority: Priority = Priority.NORMAL, **kwargs) -> Future:
+        return self.io.submit(fn, *args, priority=priority, **kwargs)
+
+    def submit_cpu(self, fn: Callable, *args, priority: Priority = Priority.NORMAL, **kwargs) -> Future:
+        """Run a picklable callable in the process pool"""
+        return self.cpu.submit(_run_in_process, self._process_pool, fn, args, kwargs, priority=priority)
+
+    async def run_io(self, fn: Callable, *args, priority: Priority = Priority.NORMAL, **kwargs) -> Any:
+        return await asyncio.wrap_future(self.submit_io(fn, *args, priority=priority, **kwargs))
+
+    async def run_cpu(self, fn: Callable, *args, priority: Priority = Priority.NORMAL, **kwargs) -> Any:
+        return await asyncio.wrap_future(self.submit_cpu(fn, *args, priority=priority, **kwargs))
+
+    async def start(self) -> None:
+        """Start loop lag monitoring and move root log handlers off the loop"""
+        self.loop_monitor.start()
+
+        root = logging.getLogger()
+        self._original_log_handlers = root.handlers[:]
+        if self._original_log_handlers:
+            log_queue: queue.Queue = queue.Queue(maxsize=self._log_queue_size)
+            self._log_handler = DroppingQueueHandler(log_queue)
+            self._log_listener = QueueListener(log_queue, *self._original_log_handlers,
+                                               respect_handler_level=True)
+            root.handlers = [self._log_handler]
+            self._log_listener.start()
+
+    async def shutdown(self) -> None:
+        await self.loop_monitor.stop()
+        self.io.shutdown(wait=False)
+        self.cpu.shutdown(wait=False)
+        await asyncio.get_running_loop().run_in_executor(None, self._join_pools)
+
+        if self._log_listener:
+            self._log_listener.stop()
+            logging.getLogger().handlers = self._original_log_handlers
+            self._log_listener = None
+
+    def _join_pools(self) -> None:
+        self.io.shutdown(wait=True)
+        self.cpu.shutdown(wait=True)
+        self._process_pool.shutdown(wait=True)
+
+    def get_stats(self) -> Dict:
+        return {
+            "io_pool": self.io.get_stats(),
+            "cpu_pool": self.cpu.get_stats(),
+            "event_loop": dict(self.loop_monitor.stats),
+            "dropped_log_records": self._log_handler.dropped if self._log_handler else 0
+        }
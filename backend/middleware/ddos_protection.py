@@ -9,10 +9,14 @@ from load_balancer import LoadBalancer
 logger = logging.getLogger(__name__)
 
 class DDoSProtectionMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, ddos_detector: DDoSDetector, load_balancer: LoadBalancer):
+    def __init__(self, app, ddos_detector: DDoSDetector, load_balancer: LoadBalancer,
+                 trust_tenant_header: bool = False):
         super().__init__(app)
         self.ddos_detector = ddos_detector
         self.load_balancer = load_balancer
+        # x-tenant-id is client-controlled; only honour it behind a proxy
+        # that authenticates the caller and sets or strips the header
+        self.trust_tenant_header = trust_tenant_header
         
     async def dispatch(
         self, 
@@ -33,7 +37,11 @@ class DDoSProtectionMiddleware(BaseHTTPMiddleware):
             }
             
             # Check for DDoS attack
-            if self.ddos_detector.is_attack(request_info):
+            if self.ddos_detector.is_attack(
+                request_info,
+                route=request.url.path,
+                tenant=request.headers.get("x-tenant-id") if self.trust_tenant_header else None
+            ):
                 logger.warning(f"DDoS attack detected from {client_host}")
                 return JSONResponse(
                     status_code=429,
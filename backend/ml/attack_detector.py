@@ -6,6 +6,7 @@ from tensorflow.keras.layers import LSTM, Dense, Input
 from collections import deque
 import logging
 from typing import List, Optional, Dict, Any
+from executors import ExecutorManager
 
 # Disable TensorFlow warnings
 tf.compat.v1.logging.set_verbosity(tf.compat.v1.logging.ERROR)
@@ -13,7 +14,6 @@ tf.compat.v1.logging.set_verbosity(tf.compat.v1.logging.ERROR)
 class AttackDetector:
     def __init__(self):
         self.request_window = deque(maxlen=100)
-        self.scaler = StandardScaler()
         self.attack_threshold = 0.8
         self.syn_flood_threshold = 100
         tf.compat.v1.disable_eager_execution()
@@ -49,7 +49,26 @@ class AttackDetector:
         if X.shape != (100, 3):
             return None
             
-        X_scaled = self.scaler.fit_transform(X)
+        return self._scale_sequence(X)
+        
+    async def prepare_sequence_data_async(self, executors: ExecutorManager) -> Optional[np.ndarray]:
+        if len(self.request_window) < 100:
+            return None
+            
+        # Snapshot the window on the event loop, scale it on the I/O pool.
+        # A 100x3 fit is far cheaper than shipping it to a process worker,
+        # which would also have to import TensorFlow to unpickle this module
+        X = np.array(list(self.request_window))[-100:]
+        
+        if X.shape != (100, 3):
+            return None
+            
+        return await executors.run_io(self._scale_sequence, X)
+        
+    def _scale_sequence(self, X: np.ndarray) -> np.ndarray:
+        # Fresh scaler per call: the window is refit every time, and a shared
+        # one would race between overlapping calls on the pool
+        X_scaled = StandardScaler().fit_transform(X)
         X_reshaped = X_scaled.reshape(1, 100, 3)
         return X_reshaped
         
@@ -4,6 +4,7 @@ from typing import Dict, List
 import logging
 import os
 import shutil
+from executors import ExecutorManager, ExecutorRejected, Priority
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -12,6 +13,8 @@ class RecoverySystem:
     def __init__(self, snapshot_dir: str = "snapshots"):
         self.snapshot_dir = snapshot_dir
         self.snapshots = []
+        # Monotonic, so ids aren't reused once old snapshots are pruned
+        self.next_snapshot_id = 0
         self.max_snapshots = 5
         self._ensure_snapshot_directory()
         
@@ -22,32 +25,68 @@ class RecoverySystem:
             
     def create_snapshot(self, system_state: Dict) -> Dict:
         """Create a new system state snapshot"""
-        timestamp = datetime.now().isoformat()
-        snapshot = {
-            "timestamp": timestamp,
-            "state": system_state,
-            "id": len(self.snapshots)
-        }
+        snapshot = self._new_snapshot(system_state)
         
         # Save snapshot to file
-        snapshot_path = os.path.join(self.snapshot_dir, f"snapshot_{snapshot['id']}.json")
-        with open(snapshot_path, 'w') as f:
-            json.dump(snapshot, f)
+        self._write_snapshot(snapshot, json.dumps(snapshot))
         
         self.snapshots.append(snapshot)
         if len(self.snapshots) > self.max_snapshots:
-            self._remove_oldest_snapshot()
+            self._delete_snapshot_file(self._remove_oldest_snapshot())
             
-        logger.info(f"Created snapshot {snapshot['id']} at {timestamp}")
+        logger.info(f"Created snapshot {snapshot['id']} at {snapshot['timestamp']}")
         return snapshot
     
-    def _remove_oldest_snapshot(self):
+    async def create_snapshot_async(self, system_state: Dict, executors: ExecutorManager) -> Dict:
+        """Create a snapshot from async code, writing files on the I/O pool.
+        
+        Raises ExecutorRejected if the write is refused or evicted, in which
+        case the snapshot is not recorded.
+        """
+        snapshot = self._new_snapshot(system_state)
+        
+        # Serialize on the event loop so the caller can't mutate the state
+        # mid-write; only the file I/O is offloaded
+        data = json.dumps(snapshot)
+        await executors.run_io(self._write_snapshot, snapshot, data, priority=Priority.LOW)
+        
+        self.snapshots.append(snapshot)
+        if len(self.snapshots) > self.max_snapshots:
+            oldest = self._remove_oldest_snapshot()
+            try:
+                await executors.run_io(self._delete_snapshot_file, oldest, priority=Priority.LOW)
+            except ExecutorRejected:
+                logger.warning(f"Could not delete file for snapshot {oldest['id']}: I/O pool is full")
+            
+        logger.info(f"Created snapshot {snapshot['id']} at {snapshot['timestamp']}")
+        return snapshot
+    
+    def _new_snapshot(self, system_state: Dict) -> Dict:
+        snapshot = {
+            "timestamp": datetime.now().isoformat(),
+            "state": system_state,
+            "id": self.next_snapshot_id
+        }
+        self.next_snapshot_id += 1
+        return snapshot
+    
+    def _snapshot_path(self, snapshot: Dict) -> str:
+        return os.path.join(self.snapshot_dir, f"snapshot_{snapshot['id']}.json")
+    
+    def _write_snapshot(self, snapshot: Dict, data: str):
+        with open(self._snapshot_path(snapshot), 'w') as f:
+            f.write(data)
+    
+    def _remove_oldest_snapshot(self) -> Dict:
         """Remove oldest snapshot when limit is reached"""
         oldest = self.snapshots.pop(0)
-        oldest_path = os.path.join(self.snapshot_dir, f"snapshot_{oldest['id']}.json")
-        if os.path.exists(oldest_path):
-            os.remove(oldest_path)
         logger.info(f"Removed oldest snapshot {oldest['id']}")
+        return oldest
+    
+    def _delete_snapshot_file(self, snapshot: Dict):
+        snapshot_path = self._snapshot_path(snapshot)
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
     
     def rollback_to_snapshot(self, snapshot_id: int) -> Dict:
         """Rollback system to a previous snapshot"""
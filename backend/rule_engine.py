@@ -0,0 +1,160 @@
+import json
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'detection_rules.json')
+
+# Positional order of the feature vector passed to compiled evaluators
+FEATURES = (
+    'syn_count',
+    'request_per_second',
+    'bytes_transferred',
+    'connection_duration',
+    'sustained_rps'
+)
+
+OPERATORS = ('>', '>=', '<', '<=')
+
+@dataclass(frozen=True)
+class DetectionRule:
+    name: str
+    feature: str
+    threshold: float
+    op: str = '>'
+    defense: Optional[str] = None
+    message: Optional[str] = None
+
+Evaluator = Callable[[float, float, float, float, float], Optional[DetectionRule]]
+
+def compile_rules(rules: List[DetectionRule]) -> Evaluator:
+    """Compile an ordered rule list into a single evaluation function.
+
+    The generated function takes the feature vector as positional arguments
+    and returns the first matching rule, or None.
+    """
+    namespace: Dict[str, object] = {}
+    lines = [f"def evaluate({', '.join(FEATURES)}):"]
+    for i, rule in enumerate(rules):
+        namespace[f'_rule{i}'] = rule
+        lines.append(f"    if {rule.feature} {rule.op} {rule.threshold!r}: return _rule{i}")
+    lines.append("    return None")
+    exec(compile('\n'.join(lines), '<detection_rules>', 'exec'), namespace)
+    return namespace['evaluate']
+
+def _threshold(value) -> float:
+    # bool is an int subclass; reject it rather than reading true as 1.0
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Threshold must be a number, got {value!r}")
+    threshold = float(value)
+    if not math.isfinite(threshold):
+        raise ValueError(f"Threshold must be a finite number, got {value!r}")
+    return threshold
+
+def _window(value) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f"'sustained_window' must be a positive integer, got {value!r}")
+    return value
+
+def _expect(value, kind: type, what: str):
+    if not isinstance(value, kind):
+        raise ValueError(f"Expected {what} to be a {kind.__name__}, got {type(value).__name__}")
+    return value
+
+def _parse_rule(spec: Dict) -> DetectionRule:
+    feature = spec['feature']
+    if feature not in FEATURES:
+        raise ValueError(f"Unknown feature '{feature}' in rule '{spec.get('name')}'")
+    op = spec.get('op', '>')
+    if op not in OPERATORS:
+        raise ValueError(f"Unsupported operator '{op}' in rule '{spec.get('name')}'")
+    return DetectionRule(
+        name=str(spec['name']),
+        feature=feature,
+        threshold=_threshold(spec['threshold']),
+        op=op,
+        defense=spec.get('defense'),
+        message=spec.get('message')
+    )
+
+class RuleSet:
+    """A parsed rule file with one compiled evaluator per override profile"""
+
+    def __init__(self, config: Dict):
+        _expect(config, dict, 'rule file')
+        _expect(config['rules'], list, "'rules'")
+        self.rules = [_parse_rule(_expect(spec, dict, 'rule')) for spec in config['rules']]
+        self.sustained_window = _window(config.get('sustained_window', 10))
+        overrides = _expect(config.get('overrides', {}), dict, "'overrides'")
+        self.route_overrides = self._parse_overrides(_expect(overrides.get('routes', {}), dict, "'routes'"))
+        self.tenant_overrides = self._parse_overrides(_expect(overrides.get('tenants', {}), dict, "'tenants'"))
+
+        self.has_overrides = bool(self.route_overrides or self.tenant_overrides)
+        self.evaluate = compile_rules(self.rules)
+        self._profiles: Dict[Tuple[Optional[str], Optional[str]], Evaluator] = {(None, None): self.evaluate}
+
+    def _parse_overrides(self, scope: Dict[str, Dict]) -> Dict[str, Dict[str, float]]:
+        known = {rule.name for rule in self.rules}
+        parsed = {}
+        for key, thresholds in scope.items():
+            _expect(thresholds, dict, f"override '{key}'")
+            unknown = set(thresholds) - known
+            if unknown:
+                raise ValueError(f"Override '{key}' references unknown rules: {sorted(unknown)}")
+            parsed[key] = {name: _threshold(value) for name, value in thresholds.items()}
+        return parsed
+
+    def select(self, route: Optional[str] = None, tenant: Optional[str] = None) -> Evaluator:
+        """Get the evaluator for a route/tenant pair, compiling it on first use.
+
+        Tenant thresholds take precedence over route thresholds.
+        """
+        if not self.has_overrides:
+            return self.evaluate
+        key = (route if route in self.route_overrides else None,
+               tenant if tenant in self.tenant_overrides else None)
+        evaluator = self._profiles.get(key)
+        if evaluator is None:
+            thresholds = {**self.route_overrides.get(key[0], {}), **self.tenant_overrides.get(key[1], {})}
+            rules = [DetectionRule(rule.name, rule.feature, thresholds.get(rule.name, rule.threshold),
+                                   rule.op, rule.defense, rule.message)
+                     for rule in self.rules]
+            evaluator = self._profiles[key] = compile_rules(rules)
+        return evaluator
+
+class RuleEngine:
+    """Loads a RuleSet from a JSON file and hot-reloads it when the file changes"""
+
+    def __init__(self, path: Optional[str] = None, reload_interval: float = 2.0):
+        self.path = path or os.getenv('DETECTION_RULES_PATH', DEFAULT_RULES_PATH)
+        self.reload_interval = reload_interval
+        self._mtime = 0.0
+        self._next_check = 0.0
+        self.ruleset = self._load()
+
+    def _load(self) -> RuleSet:
+        self._mtime = os.stat(self.path).st_mtime
+        with open(self.path) as f:
+            ruleset = RuleSet(json.load(f))
+        logging.info(f"Loaded {len(ruleset.rules)} detection rules from {self.path}")
+        return ruleset
+
+    def maybe_reload(self) -> RuleSet:
+        """Return the current rule set, reloading it if the file has changed.
+
+        The file is stat'ed at most once per reload_interval. A file that fails
+        to parse is logged and the previous rule set stays active.
+        """
+        now = time.monotonic()
+        if now < self._next_check:
+            return self.ruleset
+        self._next_check = now + self.reload_interval
+        try:
+            if os.stat(self.path).st_mtime != self._mtime:
+                self.ruleset = self._load()
+        except Exception as e:
+            logging.error(f"Failed to reload detection rules from {self.path}: {str(e)}")
+        return self.ruleset
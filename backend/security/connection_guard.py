@@ -0,0 +1,105 @@
+import asyncio
+from collections import defaultdict
+import logging
+from typing import Dict, Optional, Type
+from security.defense_mechanisms import DefenseMechanisms
+
+class ConnectionGuard:
+    """Drops hostile connections at accept time, before any HTTP parsing.
+
+    Wraps the server's HTTP protocol class so that blacklisted peers and
+    peers over their concurrent-connection cap are aborted in
+    ``connection_made`` without reaching the ASGI app or the middleware.
+    """
+
+    def __init__(self, defense: DefenseMechanisms, max_connections_per_ip: int = 50):
+        self.defense = defense
+        self.max_connections_per_ip = max_connections_per_ip
+        self.active_connections: Dict[str, int] = defaultdict(int)
+        # Set once a guarded protocol class has been built for the server
+        self.installed = False
+        self.stats = {
+            'accepted': 0,
+            'dropped_blacklisted': 0,
+            'dropped_connection_cap': 0,
+            'untracked_peers': 0
+        }
+
+    def admit(self, ip: str) -> bool:
+        """Register a new connection from ip, or refuse it"""
+        if self.defense.is_blacklisted(ip):
+            self.stats['dropped_blacklisted'] += 1
+            return False
+
+        if self.active_connections[ip] >= self.max_connections_per_ip:
+            self.stats['dropped_connection_cap'] += 1
+            return False
+
+        self.active_connections[ip] += 1
+        self.stats['accepted'] += 1
+        return True
+
+    def admit_untracked(self) -> None:
+        """Count a connection with no IP peer (e.g. a unix socket)"""
+        self.stats['untracked_peers'] += 1
+
+    def release(self, ip: str) -> None:
+        """Forget a connection previously accepted by admit()"""
+        remaining = self.active_connections.get(ip, 0) - 1
+        if remaining > 0:
+            self.active_connections[ip] = remaining
+        else:
+            self.active_connections.pop(ip, None)
+
+    def get_stats(self) -> Dict:
+        return {
+            'installed': self.installed,
+            **self.stats,
+            'tracked_ips': len(self.active_connections),
+            'max_connections_per_ip': self.max_connections_per_ip
+        }
+
+    def protocol_class(self, base: Optional[Type[asyncio.Protocol]] = None) -> Type[asyncio.Protocol]:
+        """Build an HTTP protocol class guarded by this instance.
+
+        The result can be passed as ``http=`` to ``uvicorn.run``. Defaults to
+        uvicorn's auto-selected implementation (httptools or h11).
+        """
+        if base is None:
+            from uvicorn.protocols.http.auto import AutoHTTPProtocol
+            base = AutoHTTPProtocol
+
+        guard = self
+
+        class GuardedHTTPProtocol(base):
+            _guard_admitted = False
+            _guard_ip: Optional[str] = None
+
+            def connection_made(self, transport: asyncio.Transport) -> None:
+                peer = transport.get_extra_info('peername')
+                if isinstance(peer, tuple) and peer:
+                    ip = peer[0]
+                    if not guard.admit(ip):
+                        # Close with RST; the HTTP protocol never sees the connection
+                        transport.abort()
+                        return
+                    self._guard_ip = ip
+                else:
+                    # Unix socket peers share no IP; capping them together would
+                    # cap the whole server, so let them through untracked
+                    guard.admit_untracked()
+                self._guard_admitted = True
+                super().connection_made(transport)
+
+            def connection_lost(self, exc: Optional[Exception]) -> None:
+                if not self._guard_admitted:
+                    return
+                if self._guard_ip is not None:
+                    guard.release(self._guard_ip)
+                super().connection_lost(exc)
+
+        GuardedHTTPProtocol.__name__ = f"Guarded{base.__name__}"
+        self.installed = True
+        logging.info(f"Connection guard enabled on {base.__name__} "
+                     f"(max {self.max_connections_per_ip} connections per IP)")
+        return GuardedHTTPProtocol
@@ -1,4 +1,5 @@
 import hashlib
+from executors import ExecutorManager, Priority
 
 class ProofOfWork:
     def __init__(self, difficulty=4):
@@ -13,6 +14,11 @@ class ProofOfWork:
                 return str(nonce)
             nonce += 1
             
+    async def generate_nonce_async(self, data: str, executors: ExecutorManager,
+                                   priority: Priority = Priority.NORMAL) -> str:
+        # Brute-forcing the nonce is CPU-bound; run it in the process pool
+        return await executors.run_cpu(self.generate_nonce, data, priority=priority)
+        
     def verify(self, data: str, nonce: str) -> bool:
         hash_check = hashlib.sha256(f"{data}{nonce}".encode()).hexdigest()
         return hash_check.startswith(self.target)
\ No newline at end of file